@@ -0,0 +1,135 @@
+"""Benchmark the SQLite pushdown backend on synthetic transactions."""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.sqlite_backend import (
+    build_customer_features_sqlite,
+    clean_transactions_sqlite,
+)
+
+
+COUNTRIES = ["United Kingdom", "Germany", "France", "EIRE", "Spain", "Netherlands"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SQLite backend benchmark")
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=10_000_000,
+        help="Number of synthetic transaction lines",
+    )
+    parser.add_argument(
+        "--customers",
+        type=int,
+        default=50_000,
+        help="Number of distinct customers",
+    )
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="SQLite file to use (defaults to a temporary file)",
+    )
+    parser.add_argument(
+        "--compare-pandas",
+        action="store_true",
+        help="Also time the in-memory pandas path (needs the rows to fit in RAM)",
+    )
+    return parser.parse_args()
+
+
+def generate_transactions(con: sqlite3.Connection, rows: int, customers: int) -> None:
+    """Fill a ``transactions`` table with Online Retail II shaped rows."""
+
+    country_case = " ".join(
+        f"WHEN {i} THEN '{name}'" for i, name in enumerate(COUNTRIES)
+    )
+    with con:
+        con.execute("DROP TABLE IF EXISTS transactions")
+        con.execute(
+            """
+            CREATE TABLE transactions (
+                "Invoice" TEXT,
+                "StockCode" TEXT,
+                "Quantity" INTEGER,
+                "InvoiceDate" TEXT,
+                "Price" REAL,
+                "Customer ID" REAL,
+                "Country" TEXT
+            )
+            """
+        )
+        # Roughly 2% cancellations, 1% non-positive quantities and 20% missing
+        # customer IDs, in line with the real dataset.
+        con.execute(
+            f"""
+            INSERT INTO transactions
+            WITH RECURSIVE seq(i) AS (
+                SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i + 1 < {rows}
+            )
+            SELECT
+                CASE WHEN i % 50 = 0 THEN 'C' ELSE '' END || (500000 + i / 8),
+                'SKU' || (i % 4000),
+                CASE WHEN i % 97 = 0 THEN -1 ELSE 1 + i % 12 END,
+                datetime('2009-12-01', '+' || (i % 740) || ' days', '+' || (i % 600) || ' minutes'),
+                0.5 + (i % 200) / 10.0,
+                CASE WHEN i % 5 = 0 THEN NULL ELSE 12000 + (i / 8) % {customers} END,
+                CASE (i / 8) % {customers} % {len(COUNTRIES)} {country_case} END
+            FROM seq
+            """
+        )
+
+
+def main() -> None:
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(args.db) if args.db else Path(tmpdir) / "transactions.sqlite"
+        con = sqlite3.connect(db_path)
+
+        start = time.perf_counter()
+        generate_transactions(con, args.rows, args.customers)
+        print(f"Generated {args.rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        clean_table = clean_transactions_sqlite(con)
+        clean_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        features = build_customer_features_sqlite(con, clean_table)
+        feature_seconds = time.perf_counter() - start
+
+        print(f"SQLite clean:    {clean_seconds:.1f}s")
+        print(f"SQLite features: {feature_seconds:.1f}s ({len(features):,} customers)")
+
+        if args.compare_pandas:
+            import pandas as pd
+
+            from src.cleaning import clean_transactions
+            from src.features import build_customer_features
+
+            start = time.perf_counter()
+            raw = pd.read_sql_query("SELECT * FROM transactions", con)
+            load_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            build_customer_features(clean_transactions(raw))
+            pandas_seconds = time.perf_counter() - start
+            print(f"pandas load:     {load_seconds:.1f}s")
+            print(f"pandas total:    {pandas_seconds:.1f}s")
+
+        con.close()
+
+
+if __name__ == "__main__":
+    main()
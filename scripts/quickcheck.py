@@ -5,8 +5,6 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import pandas as pd
-
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Quick checks for pipeline outputs")
@@ -20,6 +18,10 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
+
+    # Deferred so that argument errors and --help do not pay for pandas.
+    import pandas as pd
+
     outdir = Path(args.outdir)
 
     action_list_path = outdir / "customer_action_list.csv"
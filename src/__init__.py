@@ -1,25 +1,68 @@
-"""Customer retention strategy package."""
-
-from .io import load_raw_transactions
-from .cleaning import clean_transactions
-from .features import build_customer_features
-from .segmentation import score_and_segment_customers
-from .simulation import run_simulation_scenarios
-from .viz import (
-    plot_churn_risk_distribution,
-    plot_value_distribution,
-    plot_action_matrix,
-    plot_roi_by_scenario,
+"""Customer retention strategy package.
+
+Public helpers are resolved lazily on first attribute access so that
+``import src`` stays cheap: pandas is only loaded with the submodule that
+needs it and matplotlib only when a figure is actually drawn.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .io import load_raw_transactions
+    from .cleaning import clean_transactions
+    from .features import build_customer_features
+    from .segmentation import score_and_segment_customers
+    from .simulation import run_simulation_scenarios
+    from .viz import (
+        plot_churn_risk_distribution,
+        plot_value_distribution,
+        plot_action_matrix,
+        plot_roi_by_scenario,
+    )
+
+
+_LAZY_ATTRS: Dict[str, str] = {
+    "load_raw_transactions": "io",
+    "clean_transactions": "cleaning",
+    "build_customer_features": "features",
+    "score_and_segment_customers": "segmentation",
+    "run_simulation_scenarios": "simulation",
+    "plot_churn_risk_distribution": "viz",
+    "plot_value_distribution": "viz",
+    "plot_action_matrix": "viz",
+    "plot_roi_by_scenario": "viz",
+}
+
+_LAZY_SUBMODULES = (
+    "io",
+    "cleaning",
+    "features",
+    "feature_store",
+    "outputs",
+    "segmentation",
+    "simulation",
+    "sqlite_backend",
+    "viz",
 )
 
-__all__ = [
-    "load_raw_transactions",
-    "clean_transactions",
-    "build_customer_features",
-    "score_and_segment_customers",
-    "run_simulation_scenarios",
-    "plot_churn_risk_distribution",
-    "plot_value_distribution",
-    "plot_action_matrix",
-    "plot_roi_by_scenario",
-]
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        # import_module also binds the submodule as a package attribute.
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBMODULES))
@@ -26,19 +26,21 @@ COLUMN_ALIASES = {
 }
 
 
+REQUIRED_COLUMNS: List[str] = ["invoice", "quantity", "price", "invoice_date", "customer_id"]
+
+
+def normalize_column_name(name: str) -> str:
+    """Normalize a single column name to snake_case and map known aliases."""
+
+    normalized = name.strip().lower().replace(" ", "_").replace("-", "_")
+    return COLUMN_ALIASES.get(normalized, normalized)
+
+
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize column names to snake_case and map known aliases."""
 
-    normalized = (
-        df.columns.to_series()
-        .str.strip()
-        .str.lower()
-        .str.replace(" ", "_", regex=False)
-        .str.replace("-", "_", regex=False)
-    )
     df = df.copy()
-    df.columns = normalized
-    mapped: List[str] = [COLUMN_ALIASES.get(col, col) for col in df.columns]
+    mapped: List[str] = [normalize_column_name(col) for col in df.columns]
     df.columns = mapped
     return df
 
@@ -47,8 +49,7 @@ def clean_transactions(df: pd.DataFrame) -> pd.DataFrame:
     """Clean transactions according to the project spec."""
 
     df = normalize_columns(df)
-    required_cols = ["invoice", "quantity", "price", "invoice_date", "customer_id"]
-    missing = [col for col in required_cols if col not in df.columns]
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
@@ -0,0 +1,340 @@
+"""Memory-mapped customer feature store.
+
+Each feature column lives in its own fixed-width binary file that is opened
+with ``numpy.memmap``; ``meta.json`` records the row count and column dtypes.
+String columns (e.g. ``country_mode``) are dictionary-encoded as ``int32``
+codes with the categories kept in the metadata, ``-1`` meaning missing.
+Timezone-aware datetimes are stored as UTC ``datetime64[ns]`` with the zone
+recorded in the metadata.
+
+A sorted copy of the customer ids plus their row positions forms the lookup
+index, so a single customer is found with a binary search over mapped pages
+instead of loading the whole table. Opening a store only reads ``meta.json``.
+
+``upsert`` replaces the index files and ``meta.json`` atomically, so readers
+that already mapped them keep a consistent (older) view; they pick up new
+customers after calling ``refresh()``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+KEY_COLUMN = "customer_id"
+META_FILE = "meta.json"
+INDEX_KEYS_FILE = "_index_keys.bin"
+INDEX_ROWS_FILE = "_index_rows.bin"
+
+
+def _map(path: Path, dtype: np.dtype, n_rows: int, mode: str = "r") -> np.ndarray:
+    # numpy refuses to mmap an empty file.
+    if n_rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=(n_rows,))
+
+
+def _map_whole(path: Path, dtype: np.dtype) -> np.ndarray:
+    """Map a file at its full length (index files carry their own size)."""
+
+    if not path.exists():
+        return np.empty(0, dtype=dtype)
+    return _map(path, dtype, path.stat().st_size // dtype.itemsize)
+
+
+def _replace_file(path: Path, data: bytes | np.ndarray) -> None:
+    """Write ``path`` via a temporary file so readers never see it partial.
+
+    ``os.replace`` gives the file a new inode; existing mappings of the old
+    file stay valid.
+    """
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        if isinstance(data, np.ndarray):
+            data.tofile(handle)
+        else:
+            handle.write(data)
+    os.replace(tmp_path, path)
+
+
+def _column_spec(series: pd.Series) -> Dict[str, Any]:
+    """Choose the on-disk representation of a feature column."""
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        tz = getattr(series.dtype, "tz", None)
+        if tz is not None:
+            return {"dtype": np.dtype("M8[ns]").str, "tz": str(tz)}
+        return {"dtype": series.to_numpy().dtype.str}
+    if pd.api.types.is_numeric_dtype(series):
+        # Nullable extension dtypes (Int64, boolean, ...) expose the plain
+        # numpy dtype; converting them via to_numpy() would yield float/object.
+        dtype = getattr(series.dtype, "numpy_dtype", None) or series.to_numpy().dtype
+        return {"dtype": np.dtype(dtype).str}
+    return {"dtype": np.dtype(np.int32).str, "categories": []}
+
+
+def _encode_column(
+    name: str, spec: Dict[str, Any], series: pd.Series, categories: List[Any]
+) -> np.ndarray:
+    """Encode ``series`` for storage, extending ``categories`` in place."""
+
+    dtype = np.dtype(spec["dtype"])
+    if "tz" in spec:
+        utc = pd.to_datetime(series, utc=True)
+        return utc.dt.tz_localize(None).to_numpy(dtype=dtype)
+    if "categories" not in spec:
+        # Casting NaN/NA to an integer or bool dtype stores garbage.
+        if dtype.kind in "iub" and series.isna().any():
+            raise ValueError(f"Missing values in integer column: {name}")
+        return series.to_numpy(dtype=dtype)
+
+    lookup = {value: code for code, value in enumerate(categories)}
+    codes = np.full(len(series), -1, dtype=np.int32)
+    for i, value in enumerate(series.tolist()):
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            continue
+        if value not in lookup:
+            try:
+                json.dumps(value)
+            except TypeError:
+                raise ValueError(
+                    f"Value {value!r} in column {name} cannot be stored as a category"
+                ) from None
+            lookup[value] = len(categories)
+            categories.append(value)
+        codes[i] = lookup[value]
+    return codes
+
+
+def _encode_frame(
+    columns: Dict[str, Dict[str, Any]], df: pd.DataFrame
+) -> Tuple[Dict[str, np.ndarray], Dict[str, List[Any]]]:
+    """Encode every column up front; nothing is written if any column fails."""
+
+    encoded: Dict[str, np.ndarray] = {}
+    categories: Dict[str, List[Any]] = {}
+    for name, spec in columns.items():
+        categories[name] = list(spec.get("categories", []))
+        encoded[name] = _encode_column(name, spec, df[name], categories[name])
+    return encoded, categories
+
+
+class CustomerFeatureStore:
+    """Column store of customer features keyed by ``customer_id``."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        meta_path = self.path / META_FILE
+        if not meta_path.exists():
+            raise FileNotFoundError(f"Feature store not found: {self.path}")
+        self._meta: Dict[str, Any] = json.loads(meta_path.read_text())
+        # Read-only maps are opened on first use and reused for later lookups.
+        self._maps: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def create(cls, path: str | Path, df: pd.DataFrame) -> "CustomerFeatureStore":
+        """Create (or overwrite) a store at ``path`` holding ``df``."""
+
+        if KEY_COLUMN not in df.columns:
+            raise ValueError(f"Expected {KEY_COLUMN} column in features")
+
+        df = df.drop_duplicates(subset=KEY_COLUMN, keep="last")
+        columns = {name: _column_spec(df[name]) for name in df.columns}
+        encoded, categories = _encode_frame(columns, df)
+
+        store_path = Path(path)
+        store_path.mkdir(parents=True, exist_ok=True)
+        for old_file in store_path.glob("*.bin"):
+            old_file.unlink()
+
+        meta = {"n_rows": 0, "columns": columns}
+        _replace_file(store_path / META_FILE, json.dumps(meta, indent=2).encode())
+
+        store = cls(store_path)
+        store._write(encoded, categories, np.full(len(df), -1, dtype=np.int64))
+        return store
+
+    def refresh(self) -> None:
+        """Re-read ``meta.json`` and drop cached maps to see later upserts."""
+
+        self._meta = json.loads((self.path / META_FILE).read_text())
+        self._maps.clear()
+
+    def __len__(self) -> int:
+        return int(self._meta["n_rows"])
+
+    def __contains__(self, customer_id: Any) -> bool:
+        return self._row_of(customer_id) is not None
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._meta["columns"])
+
+    def _column_path(self, name: str) -> Path:
+        return self.path / f"{name}.bin"
+
+    def _dtype(self, name: str) -> np.dtype:
+        return np.dtype(self._meta["columns"][name]["dtype"])
+
+    def _mapped(self, filename: str, dtype: np.dtype) -> np.ndarray:
+        if filename not in self._maps:
+            if filename in (INDEX_KEYS_FILE, INDEX_ROWS_FILE):
+                # The index may be newer than the metadata read at open time.
+                self._maps[filename] = _map_whole(self.path / filename, dtype)
+            else:
+                self._maps[filename] = _map(self.path / filename, dtype, len(self))
+        return self._maps[filename]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a read-only memory-mapped view of a stored column.
+
+        Dictionary-encoded columns are returned as their ``int32`` codes.
+        """
+
+        if name not in self._meta["columns"]:
+            raise KeyError(name)
+        return self._mapped(self._column_path(name).name, self._dtype(name))
+
+    def _decode(self, name: str, codes: np.ndarray) -> np.ndarray:
+        categories = np.asarray(
+            self._meta["columns"][name]["categories"] + [None], dtype=object
+        )
+        # Code -1 indexes the trailing None.
+        return categories[codes]
+
+    def _decode_datetimes(self, name: str, values: np.ndarray) -> Any:
+        tz = self._meta["columns"][name]["tz"]
+        return pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(tz)
+
+    def _rows_of(self, customer_ids: np.ndarray) -> np.ndarray:
+        """Vectorized index lookup; ``-1`` marks ids not in the store."""
+
+        rows = np.full(len(customer_ids), -1, dtype=np.int64)
+        keys = self._mapped(INDEX_KEYS_FILE, self._dtype(KEY_COLUMN))
+        if len(keys) == 0:
+            return rows
+        positions = np.searchsorted(keys, customer_ids)
+        in_bounds = positions < len(keys)
+        found = in_bounds.copy()
+        found[in_bounds] = keys[positions[in_bounds]] == customer_ids[in_bounds]
+        index_rows = self._mapped(INDEX_ROWS_FILE, np.dtype(np.int64))
+        rows[found] = index_rows[positions[found]]
+        # Rows appended after our metadata was read are not visible yet.
+        rows[rows >= len(self)] = -1
+        return rows
+
+    def _row_of(self, customer_id: Any) -> Optional[int]:
+        keys = self._mapped(INDEX_KEYS_FILE, self._dtype(KEY_COLUMN))
+        position = int(keys.searchsorted(customer_id))
+        if position >= len(keys) or keys[position] != customer_id:
+            return None
+        row = int(self._mapped(INDEX_ROWS_FILE, np.dtype(np.int64))[position])
+        # Rows appended after our metadata was read are not visible yet.
+        return row if row < len(self) else None
+
+    def lookup(self, customer_id: Any) -> Dict[str, Any]:
+        """Return the stored features of a single customer."""
+
+        row = self._row_of(customer_id)
+        if row is None:
+            raise KeyError(customer_id)
+
+        record: Dict[str, Any] = {}
+        for name, spec in self._meta["columns"].items():
+            value = self.column(name)[row]
+            if "categories" in spec:
+                value = spec["categories"][value] if value >= 0 else None
+            elif "tz" in spec:
+                value = pd.Timestamp(value).tz_localize("UTC").tz_convert(spec["tz"])
+            record[name] = value
+        return record
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Build a DataFrame over the mapped columns without copying them.
+
+        Only dictionary-encoded and timezone-aware columns are materialized
+        when decoded.
+        """
+
+        data: Dict[str, np.ndarray] = {}
+        for name in columns or self.columns:
+            values = self.column(name)
+            spec = self._meta["columns"][name]
+            if "categories" in spec:
+                data[name] = self._decode(name, values)
+            elif "tz" in spec:
+                data[name] = self._decode_datetimes(name, values)
+            else:
+                # Plain ndarray views keep the memmap subclass out of pandas.
+                data[name] = np.asarray(values)
+        return pd.DataFrame(data, copy=False)
+
+    def upsert(self, df: pd.DataFrame) -> None:
+        """Overwrite rows of known customers in place and append new ones."""
+
+        missing = [col for col in self.columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+
+        df = df.drop_duplicates(subset=KEY_COLUMN, keep="last")
+        key_dtype = self._dtype(KEY_COLUMN)
+        rows = self._rows_of(df[KEY_COLUMN].to_numpy(dtype=key_dtype))
+
+        # Encode every column before touching any file so that bad input
+        # (e.g. a non-numeric value) cannot leave the columns misaligned.
+        encoded, categories = _encode_frame(self._meta["columns"], df)
+        self._write(encoded, categories, rows)
+
+    def _write(
+        self,
+        encoded: Dict[str, np.ndarray],
+        categories: Dict[str, List[Any]],
+        rows: np.ndarray,
+    ) -> None:
+        """Write pre-encoded columns; ``rows`` is ``-1`` for new customers."""
+
+        existing = rows >= 0
+        n_rows = len(self)
+        self._maps.clear()
+        for name, values in encoded.items():
+            path = self._column_path(name)
+            if existing.any():
+                target = _map(path, self._dtype(name), n_rows, "r+")
+                target[rows[existing]] = values[existing]
+                target.flush()
+            # New rows go right after the committed ones; truncating drops
+            # anything left behind by an earlier interrupted upsert.
+            with open(path, "r+b" if path.exists() else "wb") as handle:
+                handle.seek(n_rows * values.itemsize)
+                values[~existing].tofile(handle)
+                handle.truncate()
+
+        for name, spec in self._meta["columns"].items():
+            if "categories" in spec:
+                spec["categories"] = categories[name]
+        if not existing.all():
+            self._write_index(encoded[KEY_COLUMN][~existing], n_rows)
+        self._meta["n_rows"] = n_rows + int((~existing).sum())
+        self._maps.clear()
+        _replace_file(self.path / META_FILE, json.dumps(self._meta, indent=2).encode())
+
+    def _write_index(self, new_keys: np.ndarray, first_row: int) -> None:
+        """Merge keys appended at ``first_row`` onward into the sorted index."""
+
+        keys = self._mapped(INDEX_KEYS_FILE, self._dtype(KEY_COLUMN))
+        index_rows = self._mapped(INDEX_ROWS_FILE, np.dtype(np.int64))
+        order = np.argsort(new_keys, kind="stable")
+        sorted_keys = new_keys[order]
+        positions = np.searchsorted(keys, sorted_keys)
+        _replace_file(self.path / INDEX_KEYS_FILE, np.insert(keys, positions, sorted_keys))
+        _replace_file(
+            self.path / INDEX_ROWS_FILE,
+            np.insert(index_rows, positions, first_row + order.astype(np.int64)),
+        )
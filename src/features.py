@@ -26,6 +26,12 @@ def build_customer_features(df: pd.DataFrame) -> pd.DataFrame:
     )
     features = features.reset_index()
 
+    return add_derived_features(features, snapshot_date)
+
+
+def add_derived_features(features: pd.DataFrame, snapshot_date: pd.Timestamp) -> pd.DataFrame:
+    """Derive recency, span and AOV columns from per-customer aggregates."""
+
     features["recency_days"] = (snapshot_date - features["last_purchase"]).dt.days
     features["purchase_span_days"] = (
         features["last_purchase"] - features["first_purchase"]
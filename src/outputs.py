@@ -0,0 +1,145 @@
+"""Background scheduling of pipeline outputs (exports and figures)."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+
+def _timed_call(fn: Callable[..., Any], args: Tuple, kwargs: Dict) -> float:
+    """Run ``fn`` and return the CPU time it used in the calling thread.
+
+    CPU time is a lower bound on what the task would take on its own: unlike
+    wall time it is not stretched by other tasks competing for cores or the
+    GIL. Module-level so that process pools can pickle it.
+    """
+
+    start = time.thread_time()
+    fn(*args, **kwargs)
+    return time.thread_time() - start
+
+
+class OutputScheduler:
+    """Run output tasks in a worker pool while the pipeline keeps computing.
+
+    Threads suit file writes; figure rendering mostly holds the GIL, so
+    ``use_processes=True`` gives real parallelism at the cost of pickling the
+    task arguments (tasks must then be module-level functions).
+
+    At most ``max_pending`` tasks may be queued or running; ``submit`` blocks
+    once that bound is reached so large frames are not queued up without
+    limit. A failed task is re-raised by the next ``submit`` or by ``join``,
+    which also cancels whatever has not started yet.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: int = 8,
+        use_processes: bool = False,
+    ) -> None:
+        max_workers = max_workers or _default_workers()
+        self._executor: Executor
+        if use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="output"
+            )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures: List[Tuple[str, Future]] = []
+        self._durations: List[float] = []
+        self._first_submit: Optional[float] = None
+        self._first_submit_cpu = 0.0
+
+    def __enter__(self) -> "OutputScheduler":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        # On the error path, drop queued work rather than waiting on it.
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def _task_done(self, name: str, future: Future) -> None:
+        self._slots.release()
+        if not future.cancelled() and future.exception() is None:
+            self._durations.append(future.result())
+
+    def _raise_if_failed(self) -> None:
+        for _, future in self._futures:
+            if future.done() and not future.cancelled() and future.exception():
+                raise future.exception()
+
+    def submit(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue ``fn(*args, **kwargs)`` under ``name``; its result is discarded."""
+
+        self._raise_if_failed()
+        if self._first_submit is None:
+            self._first_submit = time.perf_counter()
+            self._first_submit_cpu = time.thread_time()
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(_timed_call, fn, args, kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda done: self._task_done(name, done))
+        self._futures.append((name, future))
+
+    def join(self) -> Dict[str, float | int]:
+        """Wait for all tasks and report how the outputs overlapped the compute.
+
+        ``compute_seconds`` is the wall time from the first ``submit`` until
+        ``join`` was called (the compute critical path) and ``wall_seconds``
+        the time until every output finished, so ``overhang_seconds`` is what
+        the output stage added on top of the compute.
+
+        ``saved_seconds`` is a lower bound on the time saved against running
+        the outputs after the compute: the calling thread's CPU time plus the
+        tasks' CPU time, minus the actual wall time, floored at zero. CPU time
+        leaves out I/O waits, so real savings can only be larger.
+        """
+
+        start = time.perf_counter()
+        start_cpu = time.thread_time()
+        first_submit = self._first_submit if self._first_submit is not None else start
+        futures = [future for _, future in self._futures]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        error: Optional[BaseException] = next(
+            (f.exception() for f in done if f.exception() is not None), None
+        )
+        if error is not None:
+            for future in pending:
+                future.cancel()
+        self._executor.shutdown(wait=True)
+        if error is not None:
+            raise error
+
+        end = time.perf_counter()
+        compute_seconds = start - first_submit
+        compute_cpu_seconds = start_cpu - self._first_submit_cpu
+        task_cpu_seconds = sum(self._durations)
+        wall_seconds = end - first_submit
+        return {
+            "tasks": len(futures),
+            "compute_seconds": compute_seconds,
+            "wall_seconds": wall_seconds,
+            "overhang_seconds": wall_seconds - compute_seconds,
+            "task_cpu_seconds": task_cpu_seconds,
+            "saved_seconds": max(
+                0.0, compute_cpu_seconds + task_cpu_seconds - wall_seconds
+            ),
+        }
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,17 +19,33 @@ class RiskValueConfig:
     value_threshold: float = 0.7
 
 
-def _percentile_clip(series: pd.Series, low: float = 0.05, high: float = 0.95) -> pd.Series:
-    lower, upper = series.quantile([low, high])
+def _percentile_clip(
+    series: pd.Series,
+    low: float = 0.05,
+    high: float = 0.95,
+    groups: Optional[pd.Series] = None,
+) -> pd.Series:
+    if groups is None:
+        lower, upper = series.quantile([low, high])
+    else:
+        grouped = series.groupby(groups, dropna=False)
+        lower = grouped.transform("quantile", low)
+        upper = grouped.transform("quantile", high)
     return series.clip(lower=lower, upper=upper)
 
 
-def _minmax_scale(series: pd.Series) -> pd.Series:
-    min_val = series.min()
-    max_val = series.max()
-    if max_val == min_val:
-        return pd.Series(np.zeros(len(series)), index=series.index)
-    return (series - min_val) / (max_val - min_val)
+def _minmax_scale(series: pd.Series, groups: Optional[pd.Series] = None) -> pd.Series:
+    if groups is None:
+        min_val = series.min()
+        max_val = series.max()
+        if max_val == min_val:
+            return pd.Series(np.zeros(len(series)), index=series.index)
+        return (series - min_val) / (max_val - min_val)
+
+    grouped = series.groupby(groups, dropna=False)
+    min_val = grouped.transform("min")
+    span = grouped.transform("max") - min_val
+    return ((series - min_val) / span).where(span != 0, 0.0)
 
 
 def _sigmoid(x: pd.Series | np.ndarray) -> pd.Series:
@@ -37,15 +53,32 @@ def _sigmoid(x: pd.Series | np.ndarray) -> pd.Series:
 
 
 def score_risk_value(
-    df: pd.DataFrame, config: RiskValueConfig | None = None
+    df: pd.DataFrame,
+    config: RiskValueConfig | None = None,
+    group_col: str | None = None,
 ) -> pd.DataFrame:
-    """Compute churn risk and value scores."""
+    """Compute churn risk and value scores.
+
+    Input columns are not copied, so memory-mapped feature columns (see
+    ``feature_store``) are scored in place; only the new score columns are
+    allocated. With ``group_col`` the clip bounds and scaling are computed
+    within each group (e.g. per country) instead of over all customers.
+    """
 
     config = config or RiskValueConfig()
-    df = df.copy()
+    df = df.copy(deep=False)
+    groups = None
+    if group_col is not None:
+        # Integer codes are cheaper to group by than e.g. country strings
+        # and are reused for every column below.
+        codes, _ = pd.factorize(df[group_col], use_na_sentinel=False)
+        groups = pd.Series(codes, index=df.index)
 
-    recency_scaled = _minmax_scale(_percentile_clip(df["recency_days"]))
-    frequency_scaled = _minmax_scale(_percentile_clip(df["frequency_orders"]))
+    def scaled(column: str) -> pd.Series:
+        return _minmax_scale(_percentile_clip(df[column], groups=groups), groups)
+
+    recency_scaled = scaled("recency_days")
+    frequency_scaled = scaled("frequency_orders")
 
     risk_raw = (
         config.recency_weight * recency_scaled
@@ -53,8 +86,8 @@ def score_risk_value(
     )
     df["churn_risk_score"] = _sigmoid(risk_raw)
 
-    monetary_scaled = _minmax_scale(_percentile_clip(df["monetary_total"]))
-    aov_scaled = _minmax_scale(_percentile_clip(df["avg_order_value"]))
+    monetary_scaled = scaled("monetary_total")
+    aov_scaled = scaled("avg_order_value")
     df["value_score"] = (
         config.value_weight_monetary * monetary_scaled
         + config.value_weight_aov * aov_scaled
@@ -64,15 +97,30 @@ def score_risk_value(
 
 
 def segment_customers(
-    df: pd.DataFrame, config: RiskValueConfig | None = None
+    df: pd.DataFrame,
+    config: RiskValueConfig | None = None,
+    group_col: str | None = None,
 ) -> pd.DataFrame:
-    """Assign 2x2 segments based on risk/value scores."""
+    """Assign 2x2 segments based on risk/value scores.
+
+    With ``group_col`` the risk/value thresholds are quantiles within each
+    group rather than over all customers.
+    """
 
     config = config or RiskValueConfig()
     df = df.copy()
 
-    risk_threshold = df["churn_risk_score"].quantile(config.risk_threshold)
-    value_threshold = df["value_score"].quantile(config.value_threshold)
+    if group_col is None:
+        risk_threshold = df["churn_risk_score"].quantile(config.risk_threshold)
+        value_threshold = df["value_score"].quantile(config.value_threshold)
+    else:
+        grouped = df.groupby(group_col, dropna=False)
+        risk_threshold = grouped["churn_risk_score"].transform(
+            "quantile", config.risk_threshold
+        )
+        value_threshold = grouped["value_score"].transform(
+            "quantile", config.value_threshold
+        )
 
     high_risk = df["churn_risk_score"] >= risk_threshold
     high_value = df["value_score"] >= value_threshold
@@ -94,9 +142,11 @@ def segment_customers(
 
 
 def score_and_segment_customers(
-    df: pd.DataFrame, config: RiskValueConfig | None = None
+    df: pd.DataFrame,
+    config: RiskValueConfig | None = None,
+    group_col: str | None = None,
 ) -> pd.DataFrame:
     """Convenience wrapper to score and segment."""
 
-    scored = score_risk_value(df, config=config)
-    return segment_customers(scored, config=config)
+    scored = score_risk_value(df, config=config, group_col=group_col)
+    return segment_customers(scored, config=config, group_col=group_col)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Mapping, Tuple
 
 import numpy as np
 import pandas as pd
@@ -104,66 +104,174 @@ def _summarize_scenario(
     }
 
 
+def _group_key(group: Any) -> Any:
+    """Collapse missing group labels (None, NaN, NaT) into ``None``."""
+
+    return None if pd.api.types.is_scalar(group) and pd.isna(group) else group
+
+
+def _group_sizes(df: pd.DataFrame, group_col: str) -> pd.Series:
+    return df.groupby(group_col, dropna=False)["customer_id"].nunique()
+
+
+def _group_budgets(
+    groups: pd.Index, budget: float | Mapping[Any, float], sizes: pd.Series
+) -> pd.Series:
+    """Resolve a global or per-group budget into one budget per group.
+
+    A scalar budget is split across the groups of ``sizes`` in proportion to
+    their customer counts. Customers without a group form one group, keyed
+    ``None`` in a budget mapping.
+    """
+
+    if isinstance(budget, Mapping):
+        per_group = {_group_key(group): float(value) for group, value in budget.items()}
+    else:
+        total = sizes.sum()
+        per_group = {
+            _group_key(group): float(budget) * count / total
+            for group, count in sizes.items()
+        }
+    missing = [group for group in groups if _group_key(group) not in per_group]
+    if missing:
+        raise ValueError(f"Missing budgets for groups: {missing}")
+    return pd.Series([per_group[_group_key(group)] for group in groups], index=groups)
+
+
+def _summarize_scenario_by_group(
+    name: str, df: pd.DataFrame, group_col: str, budgets: pd.Series
+) -> pd.DataFrame:
+    grouped = df.groupby(group_col, dropna=False)
+    summary = pd.DataFrame(
+        {
+            "customers_targeted": grouped["customer_id"].nunique(),
+            "total_cost": grouped["action_cost"].sum(),
+            "expected_profit_saved": grouped["expected_profit_saved"].sum(),
+        }
+    ).reindex(budgets.index, fill_value=0)
+    summary["net_profit"] = summary["expected_profit_saved"] - summary["total_cost"]
+    summary["roi"] = (summary["net_profit"] / summary["total_cost"]).where(
+        summary["total_cost"] > 0, 0.0
+    )
+    summary.insert(0, "scenario_name", name)
+    summary.insert(1, "budget", budgets)
+    summary["customers_targeted"] = summary["customers_targeted"].astype(int)
+    return summary.rename_axis(group_col).reset_index()
+
+
 def _apply_targeting(df: pd.DataFrame, target_mask: pd.Series) -> pd.DataFrame:
     targeted = df[target_mask].copy()
     return targeted
 
 
 def optimize_under_budget(
-    df: pd.DataFrame, budget: float, allow_zero_cost: bool = True
+    df: pd.DataFrame,
+    budget: float | Mapping[Any, float],
+    allow_zero_cost: bool = True,
+    group_col: str | None = None,
 ) -> Tuple[pd.DataFrame, pd.Series]:
-    candidates = df[df["expected_incremental_profit"] > 0].copy()
+    """Greedily pick the most profitable actions that fit within the budget.
+
+    With ``group_col`` every group gets its own budget and all groups are
+    allocated in one pass over the candidates, sorted once by expected
+    incremental profit. ``budget`` may then map group to budget; a single
+    budget is split across groups in proportion to their customer counts.
+    """
+
+    candidates = df[df["expected_incremental_profit"] > 0]
     candidates = candidates.sort_values(
         by=["expected_incremental_profit"], ascending=False
     )
 
-    selected_indices: List[int] = []
-    total_cost = 0.0
-    for idx, row in candidates.iterrows():
-        cost = row["action_cost"]
+    if group_col is None:
+        codes = [0] * len(candidates)
+        budgets = [float(budget)]
+    else:
+        group_codes, groups = pd.factorize(candidates[group_col], use_na_sentinel=False)
+        codes = group_codes.tolist()
+        budgets = _group_budgets(
+            pd.Index(groups), budget, _group_sizes(df, group_col)
+        ).tolist()
+
+    spent = [0.0] * len(budgets)
+    selected = np.zeros(len(candidates), dtype=bool)
+    costs = candidates["action_cost"].to_numpy(dtype=float).tolist()
+    for i, (code, cost) in enumerate(zip(codes, costs)):
         if cost == 0 and allow_zero_cost:
-            selected_indices.append(idx)
+            selected[i] = True
             continue
-        if total_cost + cost <= budget:
-            selected_indices.append(idx)
-            total_cost += cost
+        if spent[code] + cost <= budgets[code]:
+            selected[i] = True
+            spent[code] += cost
 
-    selected_mask = df.index.isin(selected_indices)
+    selected_mask = df.index.isin(candidates.index[selected])
     return df[selected_mask].copy(), pd.Series(selected_mask, index=df.index)
 
 
 def run_simulation_scenarios(
-    df: pd.DataFrame, config: SimulationConfig | None = None
+    df: pd.DataFrame,
+    config: SimulationConfig | None = None,
+    group_col: str | None = None,
+    budgets: Mapping[Any, float] | None = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Run predefined scenarios and return summary + enriched action list."""
+    """Run predefined scenarios and return summary + enriched action list.
+
+    With ``group_col`` the summary has one row per group and scenario, and
+    the optimized scenario allocates ``budgets`` per group. Without
+    ``budgets``, ``config.budget`` is split across groups in proportion to
+    their customer counts.
+    """
+
+    if budgets is not None and group_col is None:
+        raise ValueError("Per-group budgets require group_col")
 
     config = config or SimulationConfig()
     enriched = enrich_with_simulation_fields(df, config)
+    budget = budgets if budgets is not None else config.budget
+
+    if group_col is not None:
+        group_budgets = _group_budgets(
+            pd.Index(enriched[group_col].unique()),
+            budget,
+            _group_sizes(enriched, group_col),
+        )
+        budget = dict(zip(group_budgets.index, group_budgets))
 
-    scenarios: List[Dict[str, float | int | str]] = []
+    def summarize(name: str, frame: pd.DataFrame) -> pd.DataFrame:
+        if group_col is None:
+            return pd.DataFrame([_summarize_scenario(name, frame, config.budget)])
+        return _summarize_scenario_by_group(name, frame, group_col, group_budgets)
+
+    scenarios: List[pd.DataFrame] = []
 
     base_mask = enriched["recommended_action"] != "NoAction"
-    scenarios.append(
-        _summarize_scenario("BasePolicy", enriched[base_mask], config.budget)
-    )
+    scenarios.append(summarize("BasePolicy", enriched[base_mask]))
 
     save_mask = enriched["segment"] == "Save"
-    scenarios.append(_summarize_scenario("SaveOnly", enriched[save_mask], config.budget))
+    scenarios.append(summarize("SaveOnly", enriched[save_mask]))
 
     save_nurture_mask = enriched["segment"].isin(["Save", "Nurture"])
-    scenarios.append(
-        _summarize_scenario(
-            "SaveNurture", enriched[save_nurture_mask], config.budget
-        )
-    )
+    scenarios.append(summarize("SaveNurture", enriched[save_nurture_mask]))
 
     optimized_df, selected_mask = optimize_under_budget(
-        enriched, budget=config.budget
+        enriched, budget=budget, group_col=group_col
     )
     enriched["selected_under_budget"] = selected_mask
-    scenarios.append(
-        _summarize_scenario("OptimizedBudget", optimized_df, config.budget)
-    )
+    scenarios.append(summarize("OptimizedBudget", optimized_df))
 
-    summary = pd.DataFrame(scenarios)
+    summary = pd.concat(scenarios, ignore_index=True)
+    if group_col is not None:
+        summary = summary.sort_values(group_col, kind="stable").reset_index(drop=True)
     return summary, enriched
+
+
+def aggregate_group_summaries(summary: pd.DataFrame) -> pd.DataFrame:
+    """Roll a per-group scenario summary up to one row per scenario."""
+
+    totals = summary.groupby("scenario_name", sort=False)[
+        ["budget", "customers_targeted", "total_cost", "expected_profit_saved", "net_profit"]
+    ].sum()
+    totals["roi"] = (totals["net_profit"] / totals["total_cost"]).where(
+        totals["total_cost"] > 0, 0.0
+    )
+    return totals.reset_index()
@@ -0,0 +1,180 @@
+"""SQLite pushdown backend for cleaning and customer feature aggregation.
+
+Transactions that do not fit in memory can live in a local SQLite file. The
+functions here express ``clean_transactions`` and ``build_customer_features``
+as SQL so the filtering and per-customer aggregation run inside SQLite and
+only the per-customer result is streamed back into pandas.
+
+Invoice dates are expected as ISO-8601 text (what ``DataFrame.to_sql`` writes)
+and are normalized to second precision. The cleaned rows are materialized in a
+``TEMP`` table, so the input database itself is never modified.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from .cleaning import REQUIRED_COLUMNS, normalize_column_name
+from .features import add_derived_features
+
+
+DEFAULT_SOURCE_TABLE = "transactions"
+DEFAULT_CLEAN_TABLE = "transactions_clean"
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _source_column_map(con: sqlite3.Connection, table: str) -> Dict[str, str]:
+    """Map normalized column names to the raw column names of ``table``."""
+
+    rows = con.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+    if not rows:
+        raise ValueError(f"Table not found or empty schema: {table}")
+    return {normalize_column_name(row[1]): row[1] for row in rows}
+
+
+def clean_transactions_sqlite(
+    con: sqlite3.Connection,
+    source_table: str = DEFAULT_SOURCE_TABLE,
+    clean_table: str = DEFAULT_CLEAN_TABLE,
+) -> str:
+    """Materialize cleaned transactions as the temporary table ``clean_table``.
+
+    Applies the same filters as ``clean_transactions`` and indexes the result
+    for per-customer aggregation. The table lives in SQLite's ``temp`` schema
+    and disappears with the connection. Returns the name of the cleaned table.
+    """
+
+    if clean_table == source_table:
+        raise ValueError(f"clean_table must differ from source_table: {source_table}")
+
+    columns = _source_column_map(con, source_table)
+    missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    def col(name: str) -> str:
+        return _quote(columns[name])
+
+    invoice = f"CAST({col('invoice')} AS TEXT)"
+    invoice_date = f"datetime({col('invoice_date')})"
+    line_total = f"{col('quantity')} * {col('price')}"
+
+    select_items = []
+    for normalized, raw in columns.items():
+        if normalized == "invoice":
+            expr = invoice
+        elif normalized == "invoice_date":
+            expr = invoice_date
+        else:
+            expr = _quote(raw)
+        select_items.append(f"{expr} AS {_quote(normalized)}")
+    select_items.append(f"{line_total} AS line_total")
+
+    # substr() rather than LIKE: LIKE is case-insensitive in SQLite while the
+    # pandas path only treats an upper-case "C" prefix as a cancellation.
+    # COALESCE keeps NULL invoices, which pandas does not count as cancelled.
+    query = f"""
+        CREATE TEMP TABLE {_quote(clean_table)} AS
+        SELECT {", ".join(select_items)}
+        FROM {_quote(source_table)}
+        WHERE {col('customer_id')} IS NOT NULL
+          AND {invoice_date} IS NOT NULL
+          AND COALESCE(substr({invoice}, 1, 1), '') <> 'C'
+          AND {col('quantity')} > 0
+          AND {col('price')} > 0
+          AND {line_total} > 0
+    """
+
+    with con:
+        con.execute(f"DROP TABLE IF EXISTS temp.{_quote(clean_table)}")
+        con.execute(query)
+        con.execute(
+            f"CREATE INDEX {_quote(clean_table + '_customer_invoice')} "
+            f"ON {_quote(clean_table)} (customer_id, invoice)"
+        )
+        if "country" in columns:
+            con.execute(
+                f"CREATE INDEX {_quote(clean_table + '_customer_country')} "
+                f"ON {_quote(clean_table)} (customer_id, country)"
+            )
+    return clean_table
+
+
+def build_customer_features_sqlite(
+    con: sqlite3.Connection, clean_table: str = DEFAULT_CLEAN_TABLE
+) -> pd.DataFrame:
+    """Aggregate cleaned transactions into customer features inside SQLite.
+
+    Produces the same frame as ``build_customer_features``. Ties in the
+    country mode resolve to the lexicographically smallest country, matching
+    ``Series.mode()``.
+    """
+
+    table = _quote(clean_table)
+    snapshot = con.execute(f"SELECT MAX(invoice_date) FROM {table}").fetchone()[0]
+
+    # The country mode is a correlated subquery per customer so that it is
+    # answered from the (customer_id, country) index; joining a ranked CTE
+    # instead makes SQLite fall back to a nested-loop scan.
+    query = f"""
+        SELECT
+            t.customer_id,
+            t.first_purchase,
+            t.last_purchase,
+            t.frequency_orders,
+            t.monetary_total,
+            NULL AS avg_order_value,
+            (
+                SELECT c.country
+                FROM {table} AS c
+                WHERE c.customer_id = t.customer_id AND c.country IS NOT NULL
+                GROUP BY c.country
+                ORDER BY COUNT(*) DESC, c.country ASC
+                LIMIT 1
+            ) AS country_mode
+        FROM (
+            SELECT
+                customer_id,
+                MIN(invoice_date) AS first_purchase,
+                MAX(invoice_date) AS last_purchase,
+                COUNT(DISTINCT invoice) AS frequency_orders,
+                SUM(line_total) AS monetary_total
+            FROM {table}
+            GROUP BY customer_id
+        ) AS t
+        ORDER BY t.customer_id
+    """
+
+    features = pd.read_sql_query(query, con)
+    features["first_purchase"] = pd.to_datetime(features["first_purchase"])
+    features["last_purchase"] = pd.to_datetime(features["last_purchase"])
+    return add_derived_features(features, pd.Timestamp(snapshot))
+
+
+def customer_features_from_sqlite(
+    path: str | Path,
+    source_table: str = DEFAULT_SOURCE_TABLE,
+    clean_table: str = DEFAULT_CLEAN_TABLE,
+) -> pd.DataFrame:
+    """Clean and aggregate transactions stored in a SQLite file.
+
+    The file is opened read-only; only temporary tables are created.
+    """
+
+    db_path = Path(path)
+    if not db_path.exists():
+        raise FileNotFoundError(f"Input file not found: {db_path}")
+
+    con = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        clean_transactions_sqlite(con, source_table, clean_table)
+        return build_customer_features_sqlite(con, clean_table)
+    finally:
+        con.close()
@@ -1,12 +1,17 @@
-"""Visualization helpers."""
+"""Visualization helpers.
+
+Figures are built with the object-oriented ``matplotlib.figure.Figure`` API
+rather than pyplot, so no global figure state is shared and the plots can be
+rendered from worker threads (see ``outputs.OutputScheduler``).
+"""
 
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Tuple
 
-import matplotlib.pyplot as plt
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 SEGMENT_COLORS = {
@@ -21,42 +26,49 @@ def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _new_figure(figsize: Tuple[float, float]) -> Tuple[Any, Any]:
+    """Create a figure and axes; matplotlib is imported on first use."""
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots()
+
+
 def plot_churn_risk_distribution(df: pd.DataFrame, output_path: str | Path) -> None:
     output_path = Path(output_path)
     _ensure_dir(output_path.parent)
 
-    plt.figure(figsize=(6, 4))
-    plt.hist(df["churn_risk_score"], bins=30, color="#457b9d", alpha=0.8)
-    plt.title("Churn Risk Score Distribution")
-    plt.xlabel("Churn Risk Score")
-    plt.ylabel("Customers")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150)
-    plt.close()
+    fig, ax = _new_figure((6, 4))
+    ax.hist(df["churn_risk_score"], bins=30, color="#457b9d", alpha=0.8)
+    ax.set_title("Churn Risk Score Distribution")
+    ax.set_xlabel("Churn Risk Score")
+    ax.set_ylabel("Customers")
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150)
 
 
 def plot_value_distribution(df: pd.DataFrame, output_path: str | Path) -> None:
     output_path = Path(output_path)
     _ensure_dir(output_path.parent)
 
-    plt.figure(figsize=(6, 4))
-    plt.hist(df["value_score"], bins=30, color="#2a9d8f", alpha=0.8)
-    plt.title("Value Score Distribution")
-    plt.xlabel("Value Score")
-    plt.ylabel("Customers")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150)
-    plt.close()
+    fig, ax = _new_figure((6, 4))
+    ax.hist(df["value_score"], bins=30, color="#2a9d8f", alpha=0.8)
+    ax.set_title("Value Score Distribution")
+    ax.set_xlabel("Value Score")
+    ax.set_ylabel("Customers")
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150)
 
 
 def plot_action_matrix(df: pd.DataFrame, output_path: str | Path) -> None:
     output_path = Path(output_path)
     _ensure_dir(output_path.parent)
 
-    plt.figure(figsize=(6, 5))
+    fig, ax = _new_figure((6, 5))
     for segment, color in SEGMENT_COLORS.items():
         subset = df[df["segment"] == segment]
-        plt.scatter(
+        ax.scatter(
             subset["churn_risk_score"],
             subset["value_score"],
             label=segment,
@@ -64,25 +76,25 @@ def plot_action_matrix(df: pd.DataFrame, output_path: str | Path) -> None:
             s=30,
             color=color,
         )
-    plt.title("Action Matrix: Risk vs Value")
-    plt.xlabel("Churn Risk Score")
-    plt.ylabel("Value Score")
-    plt.legend(title="Segment", fontsize=8)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150)
-    plt.close()
+    ax.set_title("Action Matrix: Risk vs Value")
+    ax.set_xlabel("Churn Risk Score")
+    ax.set_ylabel("Value Score")
+    ax.legend(title="Segment", fontsize=8)
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150)
 
 
 def plot_roi_by_scenario(df: pd.DataFrame, output_path: str | Path) -> None:
     output_path = Path(output_path)
     _ensure_dir(output_path.parent)
 
-    plt.figure(figsize=(7, 4))
-    plt.bar(df["scenario_name"], df["roi"], color="#264653")
-    plt.title("ROI by Scenario")
-    plt.xlabel("Scenario")
-    plt.ylabel("ROI")
-    plt.xticks(rotation=20, ha="right")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150)
-    plt.close()
+    fig, ax = _new_figure((7, 4))
+    ax.bar(df["scenario_name"], df["roi"], color="#264653")
+    ax.set_title("ROI by Scenario")
+    ax.set_xlabel("Scenario")
+    ax.set_ylabel("ROI")
+    ax.tick_params(axis="x", labelrotation=20)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150)
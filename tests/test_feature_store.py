@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_store import CustomerFeatureStore
+from src.segmentation import score_risk_value
+
+
+def _features():
+    return pd.DataFrame(
+        {
+            "customer_id": [3.0, 1.0, 2.0, 4.0],
+            "last_purchase": pd.to_datetime(
+                ["2010-03-01", "2010-01-05", "2010-02-01", "2010-03-04"]
+            ),
+            "recency_days": [3, 58, 31, 0],
+            "frequency_orders": [2, 5, 1, 3],
+            "monetary_total": [30.0, 120.0, 5.0, 60.0],
+            "avg_order_value": [15.0, 24.0, 5.0, 20.0],
+            "country_mode": ["UK", "France", None, "UK"],
+        }
+    )
+
+
+def test_feature_store_roundtrip_and_lookup(tmp_path):
+    features = _features()
+    CustomerFeatureStore.create(tmp_path / "store", features)
+
+    store = CustomerFeatureStore(tmp_path / "store")
+    assert len(store) == 4
+    assert isinstance(store.column("monetary_total"), np.memmap)
+    pd.testing.assert_frame_equal(store.to_frame(), features, check_dtype=False)
+
+    record = store.lookup(2.0)
+    assert record["frequency_orders"] == 1
+    assert record["country_mode"] is None
+    assert 5.0 not in store
+
+
+def test_feature_store_upsert_updates_and_appends(tmp_path):
+    store = CustomerFeatureStore.create(tmp_path / "store", _features())
+    update = pd.DataFrame(
+        {
+            "customer_id": [1.0, 5.0],
+            "last_purchase": pd.to_datetime(["2010-03-05", "2010-03-05"]),
+            "recency_days": [0, 0],
+            "frequency_orders": [6, 1],
+            "monetary_total": [150.0, 12.0],
+            "avg_order_value": [25.0, 12.0],
+            "country_mode": ["France", "Spain"],
+        }
+    )
+    store.upsert(update)
+
+    reopened = CustomerFeatureStore(tmp_path / "store")
+    assert len(reopened) == 5
+    assert reopened.lookup(1.0)["frequency_orders"] == 6
+    assert reopened.lookup(5.0)["country_mode"] == "Spain"
+    assert reopened.lookup(3.0)["monetary_total"] == 30.0
+
+
+def test_feature_store_columns_score_without_copy(tmp_path):
+    store = CustomerFeatureStore.create(tmp_path / "store", _features())
+    frame = store.to_frame()
+    scored = score_risk_value(frame)
+    assert np.shares_memory(
+        scored["monetary_total"].to_numpy(), store.column("monetary_total")
+    )
+    assert "churn_risk_score" in scored.columns
+
+
+def test_feature_store_failed_upsert_leaves_store_consistent(tmp_path):
+    features = _features()
+    store = CustomerFeatureStore.create(tmp_path / "store", features.iloc[:2])
+
+    bad = features.iloc[[2]].astype({"monetary_total": object})
+    bad.loc[bad.index[0], "monetary_total"] = "x"
+    with pytest.raises(ValueError):
+        store.upsert(bad)
+
+    store.upsert(features.iloc[[3]])
+    reopened = CustomerFeatureStore(tmp_path / "store")
+    assert len(reopened) == 3
+    assert 2.0 not in reopened
+    assert reopened.lookup(4.0)["monetary_total"] == 60.0
+    pd.testing.assert_frame_equal(
+        reopened.to_frame(), features.iloc[[0, 1, 3]].reset_index(drop=True), check_dtype=False
+    )
+
+
+def test_feature_store_rejects_missing_integer_values(tmp_path):
+    store = CustomerFeatureStore.create(tmp_path / "store", _features())
+    update = _features().iloc[[0]].astype({"frequency_orders": float})
+    update.loc[update.index[0], "frequency_orders"] = np.nan
+    with pytest.raises(ValueError, match="frequency_orders"):
+        store.upsert(update)
+    assert store.lookup(3.0)["frequency_orders"] == 2
+
+
+def test_feature_store_reader_keeps_consistent_view_until_refresh(tmp_path):
+    features = _features()
+    CustomerFeatureStore.create(tmp_path / "store", features.iloc[:2])
+    reader = CustomerFeatureStore(tmp_path / "store")
+    assert reader.lookup(1.0)["monetary_total"] == 120.0
+
+    writer = CustomerFeatureStore(tmp_path / "store")
+    writer.upsert(features.iloc[2:])
+
+    assert len(reader) == 2
+    assert 4.0 not in reader
+    assert reader.lookup(3.0)["frequency_orders"] == 2
+
+    reader.refresh()
+    assert len(reader) == 4
+    assert reader.lookup(4.0)["monetary_total"] == 60.0
+    pd.testing.assert_frame_equal(reader.to_frame(), features, check_dtype=False)
+
+
+def test_feature_store_handles_tz_aware_and_nullable_columns(tmp_path):
+    features = _features()
+    features["last_purchase"] = features["last_purchase"].dt.tz_localize("Europe/London")
+    features["frequency_orders"] = features["frequency_orders"].astype("Int64")
+    store = CustomerFeatureStore.create(tmp_path / "store", features)
+
+    frame = CustomerFeatureStore(tmp_path / "store").to_frame()
+    assert str(frame["last_purchase"].dt.tz) == "Europe/London"
+    assert (frame["last_purchase"] == features["last_purchase"]).all()
+    assert store.lookup(1.0)["last_purchase"] == features["last_purchase"].iloc[1]
+    assert store.column("frequency_orders").dtype == np.int64
+
+    with_na = features.iloc[[0]].copy()
+    with_na["frequency_orders"] = pd.array([pd.NA], dtype="Int64")
+    with pytest.raises(ValueError, match="frequency_orders"):
+        store.upsert(with_na)
+
+
+def test_feature_store_rejects_unserializable_categories_before_writing(tmp_path):
+    features = _features().astype({"country_mode": object})
+    features.loc[0, "country_mode"] = pd.Timestamp("2010-01-01")
+    with pytest.raises(ValueError, match="country_mode"):
+        CustomerFeatureStore.create(tmp_path / "store", features)
+    assert not (tmp_path / "store").exists()
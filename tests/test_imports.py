@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous ceiling for ``import src`` alone; an eager pandas/matplotlib import
+# costs several hundred milliseconds and would blow well past it.
+IMPORT_BUDGET_US = 50_000
+
+
+def _run_importtime(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [part.strip() for part in line.split(":", 1)[1].split("|")]
+        if not parts[1].isdigit():
+            continue
+        cumulative[parts[2]] = int(parts[1])
+    return cumulative
+
+
+def test_import_src_does_not_load_heavy_dependencies():
+    modules = _run_importtime("import src")
+    assert "src" in modules
+    assert "pandas" not in modules
+    assert "matplotlib" not in modules
+    assert modules["src"] < IMPORT_BUDGET_US
+
+
+def test_scoring_access_does_not_load_matplotlib():
+    modules = _run_importtime(
+        "from src import score_and_segment_customers, run_simulation_scenarios"
+    )
+    assert "pandas" in modules
+    assert "matplotlib" not in modules
+
+
+def test_viz_import_defers_matplotlib():
+    modules = _run_importtime("import src.viz")
+    assert "matplotlib" not in modules
+
+
+def test_lazy_attributes_resolve():
+    import src
+    from src.cleaning import clean_transactions
+
+    assert src.clean_transactions is clean_transactions
+    assert "plot_roi_by_scenario" in dir(src)
+
+
+def test_submodule_attribute_access_stays_lazy():
+    # importlib.import_module bypasses -X importtime logging, so inspect
+    # sys.modules directly.
+    code = (
+        "import sys, src; src.viz.plot_roi_by_scenario; src.segmentation.score_risk_value; "
+        "print('src.viz' in sys.modules, 'matplotlib' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["True", "False"]
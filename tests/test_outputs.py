@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from src.outputs import OutputScheduler
+from src.viz import plot_churn_risk_distribution, plot_value_distribution
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def _spin(seconds):
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+def test_output_scheduler_runs_tasks_and_reports_stats(tmp_path):
+    df = pd.DataFrame({"churn_risk_score": [0.1, 0.5, 0.9], "value_score": [0.2, 0.4, 0.8]})
+    with OutputScheduler(max_workers=2) as outputs:
+        for i in range(3):
+            outputs.submit(f"risk_{i}", plot_churn_risk_distribution, df, tmp_path / f"risk_{i}.png")
+            outputs.submit(f"value_{i}", plot_value_distribution, df, tmp_path / f"value_{i}.png")
+        stats = outputs.join()
+
+    assert stats["tasks"] == 6
+    assert stats["task_cpu_seconds"] > 0
+    assert stats["overhang_seconds"] == pytest.approx(
+        stats["wall_seconds"] - stats["compute_seconds"]
+    )
+    assert stats["saved_seconds"] >= 0
+    assert len(list(tmp_path.glob("*.png"))) == 6
+
+
+def test_output_scheduler_propagates_errors():
+    with pytest.raises(ValueError, match="boom"):
+        with OutputScheduler(max_workers=1) as outputs:
+            outputs.submit("fails", _fail)
+            outputs.join()
+
+
+def test_output_scheduler_bounds_pending_tasks():
+    release = threading.Event()
+    outputs = OutputScheduler(max_workers=1, max_pending=1)
+    outputs.submit("blocked", release.wait)
+
+    submitted = threading.Event()
+    submitter = threading.Thread(
+        target=lambda: (outputs.submit("next", lambda: None), submitted.set())
+    )
+    submitter.start()
+    assert not submitted.wait(timeout=0.2)
+
+    release.set()
+    submitter.join(timeout=5)
+    assert submitted.is_set()
+    assert outputs.join()["tasks"] == 2
+
+
+def test_output_scheduler_accumulates_durations_for_repeated_names():
+    with OutputScheduler(max_workers=2) as outputs:
+        outputs.submit("export", _spin, 0.05)
+        outputs.submit("export", _spin, 0.05)
+        stats = outputs.join()
+
+    assert stats["task_cpu_seconds"] >= 0.1
+
+
+def test_output_scheduler_saving_does_not_exceed_real_saving():
+    compute, sleep, n_tasks = 0.3, 0.1, 4
+    start = time.perf_counter()
+    _spin(compute)
+    compute_alone = time.perf_counter() - start
+
+    with OutputScheduler(max_workers=2) as outputs:
+        for i in range(n_tasks):
+            outputs.submit(f"sleep_{i}", time.sleep, sleep)
+        _spin(compute)
+        stats = outputs.join()
+
+    serial = compute_alone + n_tasks * sleep
+    real_saving = serial - stats["wall_seconds"]
+    assert real_saving > 0
+    assert stats["saved_seconds"] <= real_saving
@@ -16,3 +16,20 @@ def test_score_and_segment_customers():
     scored = score_and_segment_customers(df)
     assert "segment" in scored.columns
     assert "recommended_action" in scored.columns
+
+
+def test_score_and_segment_customers_grouped_matches_per_group():
+    df = pd.DataFrame(
+        {
+            "customer_id": range(12),
+            "country_mode": ["UK", "FR", "UK", "FR", "UK", "FR"] * 2,
+            "recency_days": [10, 100, 5, 200, 40, 60, 7, 90, 300, 15, 25, 120],
+            "frequency_orders": [5, 1, 10, 2, 3, 4, 8, 1, 1, 6, 2, 3],
+            "monetary_total": [100, 50, 200, 30, 80, 60, 150, 20, 10, 90, 40, 70],
+            "avg_order_value": [20, 50, 20, 15, 27, 15, 19, 20, 10, 15, 20, 23],
+        }
+    )
+    grouped = score_and_segment_customers(df, group_col="country_mode")
+    for _, subset in df.groupby("country_mode"):
+        expected = score_and_segment_customers(subset)
+        pd.testing.assert_frame_equal(grouped.loc[subset.index], expected)
@@ -1,6 +1,7 @@
 import pandas as pd
+import pytest
 
-from src.simulation import run_simulation_scenarios
+from src.simulation import SimulationConfig, run_simulation_scenarios
 
 
 def test_run_simulation_scenarios_outputs():
@@ -17,3 +18,83 @@ def test_run_simulation_scenarios_outputs():
     summary, enriched = run_simulation_scenarios(df)
     assert not summary.empty
     assert "expected_incremental_profit" in enriched.columns
+
+
+def test_run_simulation_scenarios_grouped_budgets():
+    df = pd.DataFrame(
+        {
+            "customer_id": [1, 2, 3, 4, 5, 6],
+            "country_mode": ["UK", "UK", "UK", "FR", "FR", "FR"],
+            "frequency_orders": [5, 4, 6, 3, 2, 4],
+            "purchase_span_months": [2, 2, 1, 1, 1, 2],
+            "avg_order_value": [200, 150, 300, 250, 120, 90],
+            "recommended_action": [
+                "FreeShipping",
+                "FreeShipping",
+                "LoyaltyPerk",
+                "FreeShipping",
+                "LoyaltyPerk",
+                "NoAction",
+            ],
+            "segment": ["Nurture", "Nurture", "Protect", "Nurture", "Protect", "LetGo"],
+        }
+    )
+    budgets = {"UK": 8.0, "FR": 100.0}
+    summary, enriched = run_simulation_scenarios(
+        df, group_col="country_mode", budgets=budgets
+    )
+    assert len(summary) == 8
+    assert enriched.loc[enriched["country_mode"] == "UK", "selected_under_budget"].sum() == 2
+    assert enriched.loc[enriched["country_mode"] == "FR", "selected_under_budget"].sum() == 2
+
+    for country, subset in df.groupby("country_mode"):
+        config = SimulationConfig(budget=budgets[country])
+        expected_summary, expected = run_simulation_scenarios(subset, config)
+        pd.testing.assert_series_equal(
+            enriched.loc[subset.index, "selected_under_budget"],
+            expected["selected_under_budget"],
+        )
+        rows = summary[summary["country_mode"] == country].drop(columns="country_mode")
+        pd.testing.assert_frame_equal(
+            rows.reset_index(drop=True), expected_summary, check_dtype=False
+        )
+
+
+def _grouped_frame(groups):
+    n = len(groups)
+    return pd.DataFrame(
+        {
+            "customer_id": range(1, n + 1),
+            "country_mode": groups,
+            "frequency_orders": [4] * n,
+            "purchase_span_months": [2] * n,
+            "avg_order_value": [200] * n,
+            "recommended_action": ["FreeShipping"] * n,
+            "segment": ["Nurture"] * n,
+        }
+    )
+
+
+def test_run_simulation_scenarios_splits_budget_by_customer_count():
+    df = _grouped_frame(["UK", "UK", "UK", "FR"])
+    summary, enriched = run_simulation_scenarios(
+        df, SimulationConfig(budget=20.0), group_col="country_mode"
+    )
+    budgets = summary.groupby("country_mode")["budget"].first()
+    assert budgets.to_dict() == {"FR": 5.0, "UK": 15.0}
+    assert budgets.sum() == 20.0
+    assert enriched["selected_under_budget"].sum() == 4
+
+
+def test_run_simulation_scenarios_budgets_missing_group():
+    df = _grouped_frame(["UK", "UK", None, None])
+    summary, enriched = run_simulation_scenarios(
+        df, group_col="country_mode", budgets={"UK": 5.0, None: 10.0}
+    )
+    missing = enriched["country_mode"].isna()
+    assert enriched.loc[missing, "selected_under_budget"].sum() == 2
+    assert enriched.loc[~missing, "selected_under_budget"].sum() == 1
+    assert set(summary.loc[summary["country_mode"].isna(), "budget"]) == {10.0}
+
+    with pytest.raises(ValueError, match="Missing budgets"):
+        run_simulation_scenarios(df, group_col="country_mode", budgets={"UK": 5.0})
@@ -0,0 +1,77 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cleaning import clean_transactions
+from src.features import build_customer_features
+from src.sqlite_backend import (
+    build_customer_features_sqlite,
+    clean_transactions_sqlite,
+    customer_features_from_sqlite,
+)
+
+
+def _raw_transactions():
+    return pd.DataFrame(
+        {
+            "Invoice": ["A1", "A1", "A2", "C3", "c4", "A5", "A6", "A7", "A8", "A9", "A10", None],
+            "Quantity": [1, 2, 3, 1, 2, -1, 4, 1, 1, 2, 5, 2],
+            "Price": [10.0, 2.5, 4.0, 3.0, 1.5, 2.0, 0.0, 7.0, 1.0, 3.0, 2.0, 5.0],
+            "InvoiceDate": pd.to_datetime(
+                [
+                    "2010-01-01 09:00",
+                    "2010-01-01 09:00",
+                    "2010-02-03 10:30",
+                    "2010-02-04 11:00",
+                    "2010-02-05 12:00",
+                    "2010-02-06 13:00",
+                    "2010-02-07 14:00",
+                    "2010-03-01 08:15",
+                    "2010-03-02 08:15",
+                    "2010-03-03 08:15",
+                    "2010-03-04 17:45",
+                    "2010-01-20 10:00",
+                ]
+            ),
+            "Customer ID": [1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 3.0, 3.0, np.nan, 4.0, 1.0],
+            "Country": ["UK", "UK", "France", "UK", "Spain", "UK", "UK", "Italy", "Germany", "UK", None, "UK"],
+        }
+    )
+
+
+def test_sqlite_backend_matches_pandas():
+    raw = _raw_transactions()
+    con = sqlite3.connect(":memory:")
+    raw.to_sql("transactions", con, index=False)
+
+    clean_table = clean_transactions_sqlite(con)
+    sql_clean = pd.read_sql_query(f"SELECT * FROM {clean_table}", con)
+    pandas_clean = clean_transactions(raw)
+    assert len(sql_clean) == len(pandas_clean)
+    assert sorted(sql_clean["invoice"].dropna()) == sorted(pandas_clean["invoice"].dropna())
+    assert sql_clean["invoice"].isna().sum() == pandas_clean["invoice"].isna().sum() == 1
+
+    expected = build_customer_features(pandas_clean)
+    result = build_customer_features_sqlite(con, clean_table)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    con.close()
+
+
+def test_sqlite_backend_leaves_input_database_untouched(tmp_path):
+    db_path = tmp_path / "transactions.sqlite"
+    con = sqlite3.connect(db_path)
+    _raw_transactions().to_sql("transactions", con, index=False)
+    con.close()
+
+    features = customer_features_from_sqlite(db_path)
+    assert len(features) == 4
+
+    con = sqlite3.connect(db_path)
+    tables = [row[0] for row in con.execute("SELECT name FROM sqlite_master")]
+    assert tables == ["transactions"]
+    with pytest.raises(ValueError):
+        clean_transactions_sqlite(con, "transactions", "transactions")
+    assert con.execute("SELECT COUNT(*) FROM transactions").fetchone()[0] == 12
+    con.close()